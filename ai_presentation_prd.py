@@ -1,7 +1,20 @@
 from fpdf import FPDF, XPos, YPos
+import argparse
 import os
+import sys
 from datetime import datetime
 
+import tracing
+
+@tracing.traceable(
+    # Page furniture redrawn on every page
+    'header', 'footer', 'current_date',
+    # Layout helpers
+    'add_title_page_content', 'check_space_and_break', 'add_section_title',
+    'add_paragraph', 'add_bullet_list', 'add_info_box', 'add_two_column_layout',
+    # fpdf drawing primitives
+    'add_page', 'cell', 'multi_cell', 'rect', 'line', 'output',
+)
 class ProfessionalPRD(FPDF):
     def __init__(self):
         super().__init__()
@@ -62,12 +75,16 @@ class ProfessionalPRD(FPDF):
         self.line(20, self.get_y() - 5, 190, self.get_y() - 5)
         
         # Left side - date
-        self.cell(0, 10, f'Generated on {datetime.now().strftime("%B %d, %Y")}', align='L')
+        self.cell(0, 10, f'Generated on {self.current_date()}', align='L')
         
         # Right side - confidential
         self.set_x(150)
         self.cell(40, 10, 'Confidential', align='R')
     
+    def current_date(self):
+        """Return today's date formatted for the document"""
+        return datetime.now().strftime('%B %d, %Y')
+    
     def add_title_page_content(self):
         """Add content to the title page"""
         self.set_y(70)
@@ -86,7 +103,7 @@ class ProfessionalPRD(FPDF):
         # Document details
         details = [
             ('Version:', '1.0'),
-            ('Date:', datetime.now().strftime('%B %d, %Y')),
+            ('Date:', self.current_date()),
             ('Status:', 'Draft'),
             ('Author:', 'Product Team')
         ]
@@ -461,11 +478,16 @@ def create_prd_pdf():
     
     return pdf
 
-# Generate and save the PDF
-if __name__ == "__main__":
+# Command-line entry point: generate the PRD and save it to --output
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the AI Presentation Generator PRD.")
+    parser.add_argument("-o", "--output", default="AI_Presentation_Generator_PRD.pdf",
+                        help="Path of the PDF to write.")
+    args = parser.parse_args(argv)
+    
     try:
         pdf = create_prd_pdf()
-        output_path = "AI_Presentation_Generator_PRD.pdf"
+        output_path = args.output
         pdf.output(output_path)
         
         print("✅ PDF created successfully!")
@@ -474,4 +496,10 @@ if __name__ == "__main__":
         
     except Exception as e:
         print(f"❌ Error creating PDF: {e}")
-        print("Please ensure you have fpdf2 installed: pip install fpdf2")
\ No newline at end of file
+        print("Please ensure you have fpdf2 installed: pip install fpdf2")
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
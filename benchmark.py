@@ -0,0 +1,494 @@
+"""benchmark.py
+Rendering benchmark and regression check for the fpdf based generators.
+
+Two document kinds are measured:
+
+``prd``
+    A ``ProfessionalPRD`` with a title page followed by *N* sections, each one
+    exercising every layout helper.
+
+``letter``
+    A ``PDF`` containing *N* attendance request letters, one per page.
+
+For every size the benchmark records wall time (split into build and
+``output()`` time), pages per second, peak RSS and the size of the rendered
+PDF. Each case runs in a freshly spawned process so that peak RSS belongs to
+that case alone; the generator module is imported before the clock starts,
+and each case is repeated ``--repeat`` times with the fastest run reported so
+that a single noisy sample does not trip the regression check. The
+``ProfessionalPRD`` helpers (``add_paragraph``,
+``add_info_box``, ``add_two_column_layout``) are also timed individually.
+
+Example
+-------
+Run the default matrix and print a report::
+
+    python benchmark.py
+
+Record the current numbers as the committed baseline::
+
+    python benchmark.py --save-baseline
+
+Compare against the baseline, failing if wall time regresses by more than
+50%::
+
+    python benchmark.py --max-time-regression 0.5
+
+Compare 20 ``letter`` jobs run as separate ``cli.py`` processes against the
+same jobs in one ``cli.py batch`` process::
+
+    python benchmark.py --sizes 1 --startup-jobs 20
+
+Requirements
+------------
+Same as the generators themselves::
+
+    pip install fpdf2
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import platform
+import queue as queue_module
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_SIZES = [1, 10, 100, 1000, 10000]
+DEFAULT_BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+
+SAMPLE_PARAGRAPH = (
+    "A modern, AI-powered presentation generator that outperforms existing solutions "
+    "like Gamma through superior design control, real image integration, and structured "
+    "content formatting. Users input prompts to generate fully-designed, editable "
+    "presentations with professional layouts and Unsplash photography."
+)
+SAMPLE_ITEMS = [
+    "Prompt-based multi-slide creation with intelligent content organization",
+    "Structured content hierarchy (Title, Subtitle, Body, Lists)",
+    "Groq API integration for fast natural language processing",
+]
+SAMPLE_COLUMN = [
+    "Next.js 14 (App Router)",
+    "TypeScript",
+    "Tailwind CSS",
+    "Prisma ORM + PostgreSQL",
+]
+
+
+def _add_prd_section(pdf, number: int) -> None:
+    """Add one benchmark section that uses every ``ProfessionalPRD`` helper."""
+    pdf.add_section_title(f"{number}. Benchmark Section")
+    pdf.add_paragraph(SAMPLE_PARAGRAPH)
+    pdf.add_bullet_list(SAMPLE_ITEMS)
+    pdf.add_info_box("Key Capabilities", SAMPLE_ITEMS)
+    pdf.add_two_column_layout("Frontend", SAMPLE_COLUMN, "Backend", SAMPLE_COLUMN)
+
+
+def build_prd(sections: int):
+    from ai_presentation_prd import ProfessionalPRD
+
+    pdf = ProfessionalPRD()
+    pdf.add_page()
+    pdf.add_title_page_content()
+    pdf.add_page()
+    for number in range(1, sections + 1):
+        _add_prd_section(pdf, number)
+    return pdf
+
+
+def build_letters(letters: int):
+    from pdf import PDF, add_letter
+
+    pdf = PDF()
+    for _ in range(letters):
+        add_letter(pdf)
+    return pdf
+
+
+BUILDERS = {
+    "prd": build_prd,
+    "letter": build_letters,
+}
+
+# Module each builder imports, loaded before timing starts
+BUILDER_MODULES = {
+    "prd": "ai_presentation_prd",
+    "letter": "pdf",
+}
+
+
+def _peak_rss_mb() -> float | None:
+    """Return the peak resident set size of this process in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB everywhere else
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_case(kind: str, size: int) -> dict:
+    """Build and render one document, returning its measurements."""
+    start = time.perf_counter()
+    pdf = BUILDERS[kind](size)
+    built = time.perf_counter()
+    data = pdf.output()
+    finished = time.perf_counter()
+
+    wall = finished - start
+    pages = pdf.page_no()
+    return {
+        "kind": kind,
+        "size": size,
+        "pages": pages,
+        "build_s": built - start,
+        "output_s": finished - built,
+        "wall_s": wall,
+        "pages_per_s": pages / wall if wall else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": len(data),
+    }
+
+
+def run_repeated(kind: str, size: int, repeat: int) -> dict:
+    """Run :func:`run_case` *repeat* times and return the fastest run."""
+    importlib.import_module(BUILDER_MODULES[kind])
+
+    runs = [run_case(kind, size) for _ in range(repeat)]
+    result = min(runs, key=lambda run: run["wall_s"])
+    result["repeat"] = repeat
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+class CaseFailed(Exception):
+    """Raised when a benchmark case does not produce a result."""
+
+
+def _case_worker(kind: str, size: int, repeat: int, queue) -> None:
+    try:
+        queue.put(("ok", run_repeated(kind, size, repeat)))
+    except Exception as exc:
+        queue.put(("error", f"{type(exc).__name__}: {exc}"))
+
+
+def run_isolated(kind: str, size: int, repeat: int) -> dict:
+    """Run :func:`run_repeated` in a spawned process so peak RSS is per case.
+
+    Raises :class:`CaseFailed` if the case raises or the process dies
+    without reporting back (e.g. killed for running out of memory).
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_case_worker, args=(kind, size, repeat, queue))
+    process.start()
+
+    try:
+        while True:
+            try:
+                status, payload = queue.get(timeout=1)
+                break
+            except queue_module.Empty:
+                if process.is_alive():
+                    continue
+            # The process is gone; pick up a result that was flushed just before it exited
+            try:
+                status, payload = queue.get(timeout=1)
+                break
+            except queue_module.Empty:
+                process.join()
+                raise CaseFailed(
+                    f"{kind}[{size}]: worker exited with code {process.exitcode} without a result"
+                ) from None
+    finally:
+        process.join()
+
+    if status != "ok":
+        raise CaseFailed(f"{kind}[{size}]: {payload}")
+    return payload
+
+
+def time_helpers(iterations: int, repeat: int) -> dict:
+    """Return mean seconds per call for each ``ProfessionalPRD`` layout helper.
+
+    Each helper is timed *repeat* times on a fresh document and the fastest
+    run is kept.
+    """
+    from ai_presentation_prd import ProfessionalPRD
+
+    calls = {
+        "add_paragraph": lambda pdf: pdf.add_paragraph(SAMPLE_PARAGRAPH),
+        "add_info_box": lambda pdf: pdf.add_info_box("Key Capabilities", SAMPLE_ITEMS),
+        "add_two_column_layout": lambda pdf: pdf.add_two_column_layout(
+            "Frontend", SAMPLE_COLUMN, "Backend", SAMPLE_COLUMN
+        ),
+    }
+
+    results = {}
+    for name, call in calls.items():
+        timings = []
+        for _ in range(repeat):
+            pdf = ProfessionalPRD()
+            pdf.add_page()
+            pdf.add_page()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                call(pdf)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+        results[name] = {
+            "iterations": iterations,
+            "total_s": elapsed,
+            "per_call_s": elapsed / iterations,
+        }
+    return results
+
+
+def time_startup(jobs: int, command: list[str]) -> dict:
+    """Time *jobs* runs of a ``cli.py`` command, one process each versus batched."""
+    cli = Path(__file__).with_name("cli.py")
+    quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "check": True}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.perf_counter()
+        for _ in range(jobs):
+            subprocess.run([sys.executable, str(cli), *command], cwd=workdir, **quiet)
+        per_process = time.perf_counter() - start
+
+        script = f"{shlex.join(command)}\n" * jobs
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(cli), "batch"], input=script, text=True, cwd=workdir, **quiet)
+        batch = time.perf_counter() - start
+
+    return {
+        "jobs": jobs,
+        "command": shlex.join(command),
+        "per_process_s": per_process,
+        "batch_s": batch,
+    }
+
+
+def compare(current: dict, baseline: dict, thresholds: dict[str, float]) -> list[str]:
+    """Return a message for every metric that regressed past its threshold.
+
+    *thresholds* maps a metric name to the allowed fractional increase over
+    the baseline value, e.g. ``{"wall_s": 0.25}`` allows 25% slower runs.
+    """
+    failures = []
+    baseline_cases = {(case["kind"], case["size"]): case for case in baseline.get("cases", [])}
+
+    for case in current["cases"]:
+        reference = baseline_cases.get((case["kind"], case["size"]))
+        if reference is None:
+            continue
+        for metric, allowed in thresholds.items():
+            old, new = reference.get(metric), case.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > allowed:
+                failures.append(
+                    f"{case['kind']}[{case['size']}] {metric}: {old:.4g} -> {new:.4g} "
+                    f"(+{change:.0%}, allowed +{allowed:.0%})"
+                )
+
+    helper_allowed = thresholds.get("wall_s")
+    if helper_allowed is not None:
+        for name, stats in current.get("helpers", {}).items():
+            old = baseline.get("helpers", {}).get(name, {}).get("per_call_s")
+            if not old:
+                continue
+            change = (stats["per_call_s"] - old) / old
+            if change > helper_allowed:
+                failures.append(
+                    f"helper {name} per_call_s: {old * 1e6:.1f}us -> "
+                    f"{stats['per_call_s'] * 1e6:.1f}us "
+                    f"(+{change:.0%}, allowed +{helper_allowed:.0%})"
+                )
+
+    return failures
+
+
+def print_report(results: dict) -> None:
+    print(f"{'kind':<8}{'size':>7}{'pages':>8}{'wall s':>10}{'pages/s':>10}{'RSS MiB':>10}{'bytes':>12}")
+    for case in results["cases"]:
+        rss = case["peak_rss_mb"]
+        print(
+            f"{case['kind']:<8}{case['size']:>7}{case['pages']:>8}{case['wall_s']:>10.3f}"
+            f"{case['pages_per_s']:>10.1f}{'n/a' if rss is None else f'{rss:.1f}':>10}"
+            f"{case['output_bytes']:>12}"
+        )
+
+    if results.get("helpers"):
+        print()
+        print(f"{'helper':<24}{'calls':>8}{'us/call':>12}")
+        for name, stats in results["helpers"].items():
+            print(f"{name:<24}{stats['iterations']:>8}{stats['per_call_s'] * 1e6:>12.1f}")
+
+    startup = results.get("startup")
+    if startup:
+        jobs = startup["jobs"]
+        print()
+        print(f"startup: {jobs} x `cli.py {startup['command']}`")
+        print(f"  one process per job {startup['per_process_s']:>8.3f} s ({startup['per_process_s'] / jobs * 1e3:.1f} ms/job)")
+        print(f"  single batch process{startup['batch_s']:>8.3f} s ({startup['batch_s'] / jobs * 1e3:.1f} ms/job)")
+
+
+def _parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the PRD and letter generators and check for regressions.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=sorted(BUILDERS),
+        default=sorted(BUILDERS),
+        help="Document kinds to benchmark.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Number of sections (prd) or letters (letter) per document.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per case and per helper; the fastest one is reported.",
+    )
+    parser.add_argument(
+        "--helper-iterations",
+        type=int,
+        default=200,
+        help="Calls per layout helper when timing helpers; 0 skips them.",
+    )
+    parser.add_argument(
+        "--startup-jobs",
+        type=int,
+        default=0,
+        help="Jobs to run through cli.py per process and in batch mode; 0 skips this.",
+    )
+    parser.add_argument(
+        "--startup-command",
+        default="letter",
+        help="cli.py command line used for the startup comparison.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON file to compare against or save to.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the results to --baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        help="Also write the raw results to this JSON file.",
+    )
+    parser.add_argument(
+        "--max-time-regression",
+        type=float,
+        default=0.25,
+        help="Allowed fractional increase in wall time (cases and helpers).",
+    )
+    parser.add_argument(
+        "--max-rss-regression",
+        type=float,
+        default=0.25,
+        help="Allowed fractional increase in peak RSS.",
+    )
+    parser.add_argument(
+        "--max-size-regression",
+        type=float,
+        default=0.05,
+        help="Allowed fractional increase in output size.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_arguments(argv)
+    if args.repeat < 1:
+        print("❌ --repeat must be at least 1", file=sys.stderr)
+        return 2
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": [],
+        "helpers": (
+            time_helpers(args.helper_iterations, args.repeat) if args.helper_iterations > 0 else {}
+        ),
+    }
+    errors = []
+    for kind in args.kinds:
+        for size in args.sizes:
+            try:
+                results["cases"].append(run_isolated(kind, size, args.repeat))
+            except CaseFailed as exc:
+                errors.append(str(exc))
+                print(f"❌ {exc}", file=sys.stderr)
+
+    if args.startup_jobs > 0:
+        results["startup"] = time_startup(args.startup_jobs, shlex.split(args.startup_command))
+    print_report(results)
+
+    if errors:
+        print(f"\n❌ {len(errors)} case(s) failed; not saving or comparing results.", file=sys.stderr)
+        return 1
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    failures = compare(
+        results,
+        baseline,
+        {
+            "wall_s": args.max_time_regression,
+            "peak_rss_mb": args.max_rss_regression,
+            "output_bytes": args.max_size_regression,
+        },
+    )
+    if failures:
+        print(f"\n❌ {len(failures)} regression(s) against {args.baseline}:", file=sys.stderr)
+        for failure in failures:
+            print(f"   {failure}", file=sys.stderr)
+        return 1
+
+    print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""cli.py
+Single entry point for all of the college tools.
+
+Each subcommand is backed by one of the standalone scripts, which is only
+imported when that subcommand runs. ``python cli.py qr ...`` therefore never
+pays for importing ``fpdf`` or ``PyPDF2``, and ``--help`` imports nothing.
+
+Example
+-------
+Run a single tool::
+
+    python cli.py pdf2text document.pdf --stdout
+    python cli.py qr https://example.com -o example.png
+    python cli.py letter -o letter.pdf
+    python cli.py prd
+
+Run many jobs in one process, one command per line on stdin::
+
+    printf 'qr https://a.example\\nqr https://b.example\\nletter -o l.pdf\\n' | python cli.py batch
+
+Blank lines and lines starting with ``#`` are ignored. Backends stay imported
+between jobs, so only the first job of each kind pays the import cost. A
+timing summary is written to stderr; ``python benchmark.py --startup-jobs N``
+compares it against starting a new process per job.
+
+Pass ``--trace`` before the subcommand to enable :mod:`tracing`.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import shlex
+import sys
+import time
+
+# Subcommand -> (module providing ``main(argv)``, help text)
+COMMANDS = {
+    "pdf2text": ("pdf2text", "Extract plain text from PDF files."),
+    "qr": ("url2qr", "Save a QR code PNG for each URL."),
+    "letter": ("pdf", "Generate the attendance request letter."),
+    "prd": ("ai_presentation_prd", "Generate the AI Presentation Generator PRD."),
+}
+
+
+def run_command(command: str, argv: list[str]) -> int:
+    """Import the backend for *command* and run it with *argv*."""
+    module_name = COMMANDS[command][0]
+    module = importlib.import_module(module_name)
+    try:
+        status = module.main(argv)
+    except SystemExit as exc:
+        # argparse exits on --help and on bad arguments
+        status = exc.code
+    if status is None:
+        return 0
+    return status if isinstance(status, int) else 1
+
+
+def run_batch(lines) -> int:
+    """Run one job per line of *lines*, returning the number of failed jobs."""
+    failures = 0
+    jobs = 0
+    start = time.perf_counter()
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        try:
+            command, *argv = shlex.split(line)
+        except ValueError as exc:
+            print(f"❌ Line {line_number}: {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        if command not in COMMANDS:
+            print(f"❌ Line {line_number}: unknown command {command!r}", file=sys.stderr)
+            failures += 1
+            continue
+
+        jobs += 1
+        job_start = time.perf_counter()
+        try:
+            status = run_command(command, argv)
+        except Exception as exc:
+            print(f"❌ Line {line_number}: {command} failed: {exc}", file=sys.stderr)
+            status = 1
+        elapsed = time.perf_counter() - job_start
+
+        if status:
+            failures += 1
+        print(f"⏱️  Line {line_number}: {command} finished in {elapsed * 1e3:.1f} ms", file=sys.stderr)
+
+    total = time.perf_counter() - start
+    print(
+        f"📦 {jobs} job(s), {failures} failure(s) in {total:.3f} s"
+        f"{f' ({total / jobs * 1e3:.1f} ms/job)' if jobs else ''}",
+        file=sys.stderr,
+    )
+    return failures
+
+
+def _split_command(argv: list[str]) -> tuple[list[str], list[str]]:
+    """Split *argv* into the global options plus subcommand and its arguments."""
+    for index, arg in enumerate(argv):
+        if not arg.startswith("-"):
+            return argv[: index + 1], argv[index + 1 :]
+    return argv, []
+
+
+def _parse_arguments(argv: list[str]) -> argparse.Namespace:
+    epilog = "\n".join(f"  {name:<10}{help_text}" for name, (_, help_text) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        description="Run one of the college tools. Arguments after the command are passed to it.",
+        epilog=f"commands:\n{epilog}\n  {'batch':<10}Read one command per line from stdin.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Profile document-generation calls (see tracing.py).",
+    )
+    parser.add_argument(
+        "command",
+        choices=[*COMMANDS, "batch"],
+        metavar="command",
+        help="Tool to run.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    head, rest = _split_command(argv)
+    args = _parse_arguments(head)
+
+    if args.trace:
+        import tracing
+
+        tracing.enable()
+
+    if args.command == "batch":
+        if rest:
+            print("❌ batch takes no arguments; jobs are read from stdin", file=sys.stderr)
+            return 2
+        return 1 if run_batch(sys.stdin) else 0
+
+    return run_command(args.command, rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
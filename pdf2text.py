@@ -82,23 +82,28 @@ def _parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: list[str] | None = None) -> None:
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line tool, returning 1 if any input failed and 0 otherwise."""
     args = _parse_arguments(argv)
 
     multiple_inputs = len(args.input) > 1
+    failed = False
 
     for pdf_path in args.input:
         if not pdf_path.exists():
             print(f"❌ File not found: {pdf_path}", file=sys.stderr)
+            failed = True
             continue
         if pdf_path.suffix.lower() != ".pdf":
             print(f"⚠️  Skipping non-PDF file: {pdf_path}", file=sys.stderr)
+            failed = True
             continue
 
         try:
             text = extract_text_from_pdf(pdf_path)
         except Exception as exc:
             print(f"❌ Failed to read {pdf_path}: {exc}", file=sys.stderr)
+            failed = True
             continue
 
         # Always save to .txt next to the PDF
@@ -108,6 +113,7 @@ def main(argv: list[str] | None = None) -> None:
             print(f"✅ Extracted text saved to {out_path}")
         except Exception as exc:
             print(f"❌ Could not write to {out_path}: {exc}", file=sys.stderr)
+            failed = True
 
         # Optionally print to stdout
         if args.stdout:
@@ -116,6 +122,8 @@ def main(argv: list[str] | None = None) -> None:
                 sys.stdout.write(banner)
             sys.stdout.write(text + "\n")
 
+    return 1 if failed else 0
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
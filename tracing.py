@@ -0,0 +1,200 @@
+"""tracing.py
+Opt-in profiling hooks for the document generators.
+
+Classes and modules declare which of their calls are worth tracing with
+:func:`traceable` and :func:`trace_functions`. Nothing is wrapped until
+tracing is enabled, either by setting ``COLLEGE_TOOLS_TRACE=1`` before the
+tools are started or by calling :func:`enable` (the ``--trace`` flag of the
+command-line tools). With tracing disabled the original methods are left in
+place, so there is no per-call overhead.
+
+When enabled, every traced call is recorded per call site (the directory, file
+and line that made it, e.g. ``qrcode/main.py:357``) with its call count,
+inclusive time and self time. On exit a summary table is written to stderr
+and the call stacks are written in the collapsed format understood by
+``flamegraph.pl`` and speedscope, one ``frame;frame;frame microseconds`` line
+per stack.
+
+Example
+-------
+Profile the PRD generator::
+
+    COLLEGE_TOOLS_TRACE=1 python ai_presentation_prd.py
+    flamegraph.pl trace.folded > trace.svg
+
+Write the collapsed stacks somewhere else::
+
+    COLLEGE_TOOLS_TRACE=1 COLLEGE_TOOLS_TRACE_OUTPUT=/tmp/prd.folded python ai_presentation_prd.py
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, TextIO
+
+ENV_VAR = "COLLEGE_TOOLS_TRACE"
+OUTPUT_ENV_VAR = "COLLEGE_TOOLS_TRACE_OUTPUT"
+DEFAULT_OUTPUT = Path("trace.folded")
+
+# (owner, label prefix, attribute names) for everything declared traceable
+_targets: list[tuple[object, str, tuple[str, ...]]] = []
+_tracer: Tracer | None = None
+
+
+class Tracer:
+    """Collect per-call-site and per-stack timings for wrapped calls."""
+
+    def __init__(self) -> None:
+        # (name, call site) -> [calls, inclusive seconds, self seconds]
+        self.sites: dict[tuple[str, str], list] = {}
+        # "outer;inner" -> self seconds
+        self.stacks: dict[str, float] = {}
+        # [name, seconds spent in traced children] for each active call
+        self._active: list[list] = []
+
+    def call(self, name: str, func: Callable, args: tuple, kwargs: dict):
+        # Frame 0 is this method, 1 the wrapper, 2 the code that made the call
+        caller = sys._getframe(2)
+        site = f"{_short_path(caller.f_code.co_filename)}:{caller.f_lineno}"
+
+        frame = [name, 0.0]
+        self._active.append(frame)
+        stack = ";".join(active[0] for active in self._active)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._active.pop()
+            if self._active:
+                self._active[-1][1] += elapsed
+            own = elapsed - frame[1]
+
+            stats = self.sites.setdefault((name, site), [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += own
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + own
+
+    def write_report(self, stream: TextIO = sys.stderr, limit: int | None = 30) -> None:
+        """Write the call sites with the most self time to *stream*."""
+        rows = sorted(self.sites.items(), key=lambda item: item[1][2], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+
+        stream.write(f"{'call':<40}{'site':<40}{'calls':>8}{'total ms':>11}{'self ms':>11}{'us/call':>10}\n")
+        for (name, site), (calls, total, own) in rows:
+            stream.write(
+                f"{name:<40}{site:<40}{calls:>8}{total * 1e3:>11.2f}{own * 1e3:>11.2f}"
+                f"{total / calls * 1e6:>10.1f}\n"
+            )
+
+    def write_folded(self, path: Path) -> None:
+        """Write the collapsed call stacks to *path* for flame graph tools."""
+        lines = [f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(self.stacks.items())]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _short_path(path: str) -> str:
+    """Return *path* as ``parent/file`` so e.g. qrcode's ``main.py`` is unambiguous."""
+    parent = os.path.basename(os.path.dirname(path))
+    name = os.path.basename(path)
+    return f"{parent}/{name}" if parent else name
+
+
+def _wrap(tracer: Tracer, name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return tracer.call(name, func, args, kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def _instrument(owner: object, prefix: str, names: tuple[str, ...]) -> None:
+    for name in names:
+        func = getattr(owner, name)
+        if getattr(func, "__traced__", False):
+            continue
+        setattr(owner, name, _wrap(_tracer, f"{prefix}.{name}", func))
+
+
+def _register(owner: object, prefix: str, names: tuple[str, ...]) -> None:
+    _targets.append((owner, prefix, names))
+    if _tracer is not None:
+        _instrument(owner, prefix, names)
+
+
+def traceable(*names: str):
+    """Class decorator declaring the methods of the class to trace.
+
+    Inherited methods (e.g. ``FPDF.multi_cell``) may be listed too; they are
+    wrapped on the decorated class only.
+    """
+
+    def decorate(cls):
+        _register(cls, cls.__name__, names)
+        return cls
+
+    return decorate
+
+
+def trace_functions(module_name: str, *names: str) -> None:
+    """Declare module level functions of *module_name* to trace.
+
+    Callers must look the functions up through the module globals at call
+    time for the wrappers to be seen.
+    """
+    module = sys.modules[module_name]
+    prefix = module_name
+    if module_name == "__main__" and getattr(module, "__file__", None):
+        prefix = Path(module.__file__).stem
+    _register(module, prefix, names)
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def enable(output: str | Path | None = None) -> Tracer:
+    """Start tracing and report the results when the interpreter exits.
+
+    The collapsed stacks go to *output*, ``$COLLEGE_TOOLS_TRACE_OUTPUT`` or
+    ``trace.folded`` in the working directory, in that order.
+    """
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+
+    _tracer = Tracer()
+    for owner, prefix, names in _targets:
+        _instrument(owner, prefix, names)
+
+    if output is None:
+        output = os.environ.get(OUTPUT_ENV_VAR) or DEFAULT_OUTPUT
+    atexit.register(_report_at_exit, _tracer, Path(output))
+    return _tracer
+
+
+def _report_at_exit(tracer: Tracer, output: Path) -> None:
+    if not tracer.sites:
+        return
+    sys.stderr.write("\n")
+    tracer.write_report(sys.stderr)
+    try:
+        tracer.write_folded(output)
+        sys.stderr.write(f"🔥 Flame graph stacks written to {output.resolve()}\n")
+    except OSError as exc:
+        sys.stderr.write(f"❌ Could not write trace to {output}: {exc}\n")
+
+
+if os.environ.get(ENV_VAR, "").lower() not in ("", "0", "false", "no"):
+    enable()
@@ -1,18 +1,50 @@
 
+from __future__ import annotations
+
+import argparse
 import qrcode
+import sys
 import uuid
 
-def url_to_qr(url: str):
+import tracing
+
+DEFAULT_URL = "https://drive.google.com/drive/folders/1jeSLfdM_Bb8Ld8e9JCovUo2ZrdSP7szc?usp=sharing"
+
+# QR matrix construction and image rendering
+tracing.traceable('make', 'make_image')(qrcode.QRCode)
+
+def save_qr(image, filename: str) -> None:
+    # Encode the QR image as PNG and write it to disk
+    image.save(filename)
+
+def url_to_qr(url: str, filename: str | None = None) -> str:
     # File name format: aiccimages_<unique_id>.png
-    filename = f"aiccimages_{uuid.uuid4().hex}.png"
+    if filename is None:
+        filename = f"aiccimages_{uuid.uuid4().hex}.png"
 
     # Generate QR code for the given URL
     qr = qrcode.make(url)
 
     # Save the QR code image
-    qr.save(filename)
+    save_qr(qr, filename)
 
     print(f"QR code for '{url}' saved as {filename}")
+    return filename
+
+tracing.trace_functions(__name__, 'save_qr', 'url_to_qr')
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Save a QR code PNG for each URL.")
+    parser.add_argument("urls", nargs="*", default=[DEFAULT_URL], help="URL(s) to encode.")
+    parser.add_argument("-o", "--output", help="PNG path to write (only with a single URL).")
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.urls) > 1:
+        parser.error("--output can only be used with a single URL")
+
+    for url in args.urls:
+        url_to_qr(url, args.output)
+    return 0
 
-# Example usage
-url_to_qr("https://drive.google.com/drive/folders/1jeSLfdM_Bb8Ld8e9JCovUo2ZrdSP7szc?usp=sharing")
+if __name__ == "__main__":
+    sys.exit(main())